@@ -1,5 +1,5 @@
 import re
-from typing import List, Optional
+from typing import List, Optional, Set, Tuple
 
 from fastapi import HTTPException, Request, status
 
@@ -14,6 +14,26 @@ from litellm.proxy._types import (
 
 from .auth_checks_organization import _user_is_org_admin
 
+# set views over LiteLLMRoutes.openai_routes for O(1) membership checks in
+# the per-request auth path. The underlying list grows when pass-through
+# endpoints with auth are initialized, so the views are rebuilt whenever its
+# length changes.
+_openai_routes_set: Set[str] = set()
+_openai_routes_with_placeholders: Tuple[str, ...] = ()
+_openai_routes_len: int = -1
+
+_anthropic_routes_set = frozenset(LiteLLMRoutes.anthropic_routes.value)
+
+
+def _get_openai_route_views() -> Tuple[Set[str], Tuple[str, ...]]:
+    global _openai_routes_set, _openai_routes_with_placeholders, _openai_routes_len
+    routes = LiteLLMRoutes.openai_routes.value
+    if len(routes) != _openai_routes_len:
+        _openai_routes_set = set(routes)
+        _openai_routes_with_placeholders = tuple(r for r in routes if "{" in r)
+        _openai_routes_len = len(routes)
+    return _openai_routes_set, _openai_routes_with_placeholders
+
 
 class RouteChecks:
     @staticmethod
@@ -189,10 +209,11 @@ class RouteChecks:
             - False: if route is not an OpenAI route
         """
 
-        if route in LiteLLMRoutes.openai_routes.value:
+        openai_routes_set, openai_routes_with_placeholders = _get_openai_route_views()
+        if route in openai_routes_set:
             return True
 
-        if route in LiteLLMRoutes.anthropic_routes.value:
+        if route in _anthropic_routes_set:
             return True
 
         if RouteChecks.check_route_access(
@@ -203,14 +224,10 @@ class RouteChecks:
 
         # fuzzy match routes like "/v1/threads/thread_49EIN5QF32s4mH20M7GFKdlZ"
         # Check for routes with placeholders
-        for openai_route in LiteLLMRoutes.openai_routes.value:
-            # Replace placeholders with regex pattern
-            # placeholders are written as "/threads/{thread_id}"
-            if "{" in openai_route:
-                if RouteChecks._route_matches_pattern(
-                    route=route, pattern=openai_route
-                ):
-                    return True
+        # placeholders are written as "/threads/{thread_id}"
+        for openai_route in openai_routes_with_placeholders:
+            if RouteChecks._route_matches_pattern(route=route, pattern=openai_route):
+                return True
 
         if RouteChecks._is_azure_openai_route(route=route):
             return True
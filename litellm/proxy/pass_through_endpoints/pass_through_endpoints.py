@@ -1,15 +1,31 @@
-import ast
 import asyncio
-import copy
 import json
+import logging
+import re
+import time
 import traceback
 import uuid
 from base64 import b64encode
-from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlencode, urlparse
 
 import httpx
+import orjson
 from fastapi import (
     APIRouter,
     Depends,
@@ -20,7 +36,7 @@ from fastapi import (
     UploadFile,
     status,
 )
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from starlette.datastructures import UploadFile as StarletteUploadFile
 
 import litellm
@@ -29,11 +45,12 @@ from litellm.constants import MAXIMUM_TRACEBACK_LINES_TO_LOG
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
-from litellm.llms.custom_httpx.http_handler import get_async_httpx_client
 from litellm.passthrough import BasePassthroughUtils
 from litellm.proxy._types import (
+    CommonProxyErrors,
     ConfigFieldInfo,
     ConfigFieldUpdate,
+    LiteLLMRoutes,
     PassThroughEndpointResponse,
     PassThroughGenericEndpoint,
     ProxyException,
@@ -42,30 +59,136 @@ from litellm.proxy._types import (
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 from litellm.proxy.common_request_processing import ProxyBaseLLMRequestProcessing
 from litellm.proxy.common_utils.http_parsing_utils import _read_request_body
+from litellm.proxy.types_utils.utils import get_instance_fn
 from litellm.secret_managers.main import get_secret_str
-from litellm.types.llms.custom_http import httpxSpecialProvider
 from litellm.types.passthrough_endpoints.pass_through_endpoints import (
     EndpointType,
     PassthroughStandardLoggingPayload,
 )
-from litellm.types.utils import StandardLoggingUserAPIKeyMetadata
+from litellm.types.utils import StandardLoggingUserAPIKeyMetadata, all_litellm_params
 
 from .streaming_handler import PassThroughStreamingHandler
 from .success_handler import PassThroughEndpointLogging
 
+if TYPE_CHECKING:
+    from litellm.router import Router as _Router
+
+    LitellmRouter = _Router
+else:
+    LitellmRouter = Any
+
 router = APIRouter()
 
+# precomputed for O(1) membership checks when filtering litellm params
+# out of pass-through request bodies
+_ALL_LITELLM_PARAMS = frozenset(all_litellm_params)
+
+# response headers that should not be forwarded back to the client
+_EXCLUDED_RESPONSE_HEADERS = frozenset(("transfer-encoding", "content-encoding"))
+
+# path tokens that identify a Vertex AI pass-through request
+_VERTEX_PATH_TOKENS = (
+    "generateContent",
+    "streamGenerateContent",
+    "rawPredict",
+    "streamRawPredict",
+)
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# shared httpx client for all pass-through requests - reusing a single client
+# keeps upstream connections pooled (keep-alive) instead of paying a TCP+TLS
+# handshake per request
+_pass_through_async_client: Optional[httpx.AsyncClient] = None
+_pass_through_client_lock = asyncio.Lock()
+
+
+async def get_pass_through_async_client() -> httpx.AsyncClient:
+    """
+    Lazily initialize and return the shared httpx client used for pass-through
+    requests.
+    """
+    global _pass_through_async_client
+    if _pass_through_async_client is None:
+        async with _pass_through_client_lock:
+            if _pass_through_async_client is None:
+                _pass_through_async_client = httpx.AsyncClient(
+                    # multiplex concurrent requests over a few long-lived
+                    # connections when the upstream speaks HTTP/2; requires
+                    # the optional `h2` package
+                    http2=_HTTP2_AVAILABLE,
+                    timeout=httpx.Timeout(timeout=600.0, connect=5.0),
+                    # tuned for a concurrency-heavy, I/O-bound proxy
+                    # workload: keep plenty of warm connections around and
+                    # hold them longer to minimise connection churn
+                    limits=httpx.Limits(
+                        max_connections=1000,
+                        max_keepalive_connections=200,
+                        keepalive_expiry=90.0,
+                    ),
+                )
+    return _pass_through_async_client
+
+
+async def close_pass_through_async_client():
+    """
+    Close the shared pass-through httpx client. Called on proxy shutdown.
+    """
+    global _pass_through_async_client
+    if _pass_through_async_client is not None:
+        await _pass_through_async_client.aclose()
+        _pass_through_async_client = None
+
+
 pass_through_endpoint_logging = PassThroughEndpointLogging()
 
 
+# strong references to fire-and-forget tasks - asyncio itself only keeps a
+# weak reference, so an untracked task can be garbage collected mid-flight
+_background_tasks: Set["asyncio.Task"] = set()
+
+
+def _create_background_task(coro: Coroutine) -> "asyncio.Task":
+    """
+    Schedule a fire-and-forget coroutine, keeping a strong reference to the
+    task until it completes.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+# matches `os.environ/VARIABLE_NAME` references inside header values
+_OS_ENV_RE = re.compile(r"os\.environ/([A-Za-z0-9_]+)")
+
+
+@lru_cache(maxsize=32)
+def _langfuse_basic_auth_header(
+    public_key: Optional[str], secret_key: Optional[str]
+) -> str:
+    """
+    Memoized Langfuse Basic auth header - the keys are static, so the
+    b64encode only needs to run once per key pair.
+    """
+    return "Basic " + b64encode(f"{public_key}:{secret_key}".encode("utf-8")).decode(
+        "ascii"
+    )
+
+
 def get_response_body(response: httpx.Response) -> Optional[dict]:
     try:
-        return response.json()
+        return orjson.loads(response.content)
     except Exception:
         return None
 
 
-async def set_env_variables_in_header(custom_headers: Optional[dict]) -> Optional[dict]:
+def set_env_variables_in_header(custom_headers: Optional[dict]) -> Optional[dict]:
     """
     checks if any headers on config.yaml are defined as os.environ/COHERE_API_KEY etc
 
@@ -77,6 +200,13 @@ async def set_env_variables_in_header(custom_headers: Optional[dict]) -> Optiona
     """
     if custom_headers is None:
         return None
+    if not any(
+        key in ("LANGFUSE_PUBLIC_KEY", "LANGFUSE_SECRET_KEY")
+        or (isinstance(value, str) and "os.environ/" in value)
+        for key, value in custom_headers.items()
+    ):
+        # nothing to substitute - skip rebuilding the dict entirely
+        return custom_headers
     headers = {}
     for key, value in custom_headers.items():
         # langfuse Api requires base64 encoded headers - it's simpleer to just ask litellm users to set their langfuse public and secret keys
@@ -93,9 +223,9 @@ async def set_env_variables_in_header(custom_headers: Optional[dict]) -> Optiona
                 _langfuse_secret_key, str
             ) and _langfuse_secret_key.startswith("os.environ/"):
                 _langfuse_secret_key = get_secret_str(_langfuse_secret_key)
-            headers["Authorization"] = "Basic " + b64encode(
-                f"{_langfuse_public_key}:{_langfuse_secret_key}".encode("utf-8")
-            ).decode("ascii")
+            headers["Authorization"] = _langfuse_basic_auth_header(
+                _langfuse_public_key, _langfuse_secret_key
+            )
         else:
             # for all other headers
             headers[key] = value
@@ -103,21 +233,88 @@ async def set_env_variables_in_header(custom_headers: Optional[dict]) -> Optiona
                 verbose_proxy_logger.debug(
                     "pass through endpoint - looking up 'os.environ/' variable"
                 )
-                # get string section that is os.environ/
-                start_index = value.find("os.environ/")
-                _variable_name = value[start_index:]
-
-                verbose_proxy_logger.debug(
-                    "pass through endpoint - getting secret for variable name: %s",
-                    _variable_name,
+                # substitute each `os.environ/NAME` reference with its secret
+                # value; unresolvable references are left untouched
+                headers[key] = _OS_ENV_RE.sub(
+                    lambda m: get_secret_str(m.group(0)) or m.group(0),
+                    value,
                 )
-                _secret_value = get_secret_str(_variable_name)
-                if _secret_value is not None:
-                    new_value = value.replace(_variable_name, _secret_value)
-                    headers[key] = new_value
     return headers
 
 
+def _get_router_model_lookup(llm_router: LitellmRouter) -> Dict[str, FrozenSet[str]]:
+    """
+    Return frozenset views of the router's model names / deployment names /
+    model ids.
+
+    The snapshot is cached on the router instance itself - a strong
+    reference, so a recycled id() can never alias a new router - and
+    invalidated by comparing the actual collections, so in-place deployment
+    swaps that leave the counts unchanged still rebuild the views.
+    """
+    model_ids = llm_router.get_model_ids()
+    signature = (
+        tuple(llm_router.model_names),
+        tuple(llm_router.deployment_names),
+        tuple(model_ids),
+    )
+    cached = getattr(llm_router, "_pass_through_model_lookup_cache", None)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    lookup: Dict[str, FrozenSet[str]] = {
+        "model_names": frozenset(llm_router.model_names),
+        "deployment_names": frozenset(llm_router.deployment_names),
+        "model_ids": frozenset(model_ids),
+    }
+    setattr(llm_router, "_pass_through_model_lookup_cache", (signature, lookup))
+    return lookup
+
+
+def _resolve_adapter_completion_task(
+    data: dict,
+    llm_router: Optional[LitellmRouter],
+    user_model: Optional[str],
+) -> Optional["asyncio.Task"]:
+    """
+    Pick the callable that should serve this adapter-completion request and
+    schedule it.
+
+    Mirrors the routing rules previously inlined in
+    chat_completion_pass_through_endpoint, but consults cached membership
+    sets instead of scanning the router's model lists per request.
+
+    Returns the scheduled task, or None if no route matched.
+    """
+    if "api_key" in data:
+        # skip router if user passed their key
+        return asyncio.create_task(litellm.aadapter_completion(**data))
+
+    if llm_router is not None:
+        model = data.get("model", None)
+        lookup = _get_router_model_lookup(llm_router)
+        if model in lookup["model_names"] or (
+            llm_router.model_group_alias is not None
+            and model in llm_router.model_group_alias
+        ):  # model in router model list / model_group_alias
+            return asyncio.create_task(llm_router.aadapter_completion(**data))
+        if model in lookup["deployment_names"]:
+            # calling a specific deployment on the router
+            return asyncio.create_task(
+                llm_router.aadapter_completion(**data, specific_deployment=True)
+            )
+        if model in lookup["model_ids"]:
+            return asyncio.create_task(llm_router.aadapter_completion(**data))
+        if llm_router.default_deployment is not None:
+            # model not in router model list, fall back to default deployment
+            return asyncio.create_task(llm_router.aadapter_completion(**data))
+
+    if user_model is not None:  # `litellm --model <your-model-name>`
+        return asyncio.create_task(litellm.aadapter_completion(**data))
+
+    return None
+
+
 async def chat_completion_pass_through_endpoint(  # noqa: PLR0915
     fastapi_response: Response,
     request: Request,
@@ -141,17 +338,19 @@ async def chat_completion_pass_through_endpoint(  # noqa: PLR0915
     data = {}
     try:
         body = await request.body()
-        body_str = body.decode()
         try:
-            data = ast.literal_eval(body_str)
-        except Exception:
-            data = json.loads(body_str)
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # Fall back to the standard json module which is more forgiving
+            data = json.loads(body.decode())
 
         data["adapter_id"] = adapter_id
 
-        verbose_proxy_logger.debug(
-            "Request received by LiteLLM:\n{}".format(json.dumps(data, indent=4)),
-        )
+        if verbose_proxy_logger.isEnabledFor(logging.DEBUG):
+            verbose_proxy_logger.debug(
+                "Request received by LiteLLM:\n%s",
+                orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(),
+            )
         data["model"] = (
             general_settings.get("completion_model", None)  # server default
             or user_model  # model name passed via cli args
@@ -191,39 +390,10 @@ async def chat_completion_pass_through_endpoint(  # noqa: PLR0915
         )
 
         ### ROUTE THE REQUESTs ###
-        router_model_names = llm_router.model_names if llm_router is not None else []
-        # skip router if user passed their key
-        if "api_key" in data:
-            llm_response = asyncio.create_task(litellm.aadapter_completion(**data))
-        elif (
-            llm_router is not None and data["model"] in router_model_names
-        ):  # model in router model list
-            llm_response = asyncio.create_task(llm_router.aadapter_completion(**data))
-        elif (
-            llm_router is not None
-            and llm_router.model_group_alias is not None
-            and data["model"] in llm_router.model_group_alias
-        ):  # model set in model_group_alias
-            llm_response = asyncio.create_task(llm_router.aadapter_completion(**data))
-        elif (
-            llm_router is not None and data["model"] in llm_router.deployment_names
-        ):  # model in router deployments, calling a specific deployment on the router
-            llm_response = asyncio.create_task(
-                llm_router.aadapter_completion(**data, specific_deployment=True)
-            )
-        elif (
-            llm_router is not None and data["model"] in llm_router.get_model_ids()
-        ):  # model in router model list
-            llm_response = asyncio.create_task(llm_router.aadapter_completion(**data))
-        elif (
-            llm_router is not None
-            and data["model"] not in router_model_names
-            and llm_router.default_deployment is not None
-        ):  # model in router deployments, calling a specific deployment on the router
-            llm_response = asyncio.create_task(llm_router.aadapter_completion(**data))
-        elif user_model is not None:  # `litellm --model <your-model-name>`
-            llm_response = asyncio.create_task(litellm.aadapter_completion(**data))
-        else:
+        llm_response = _resolve_adapter_completion_task(
+            data=data, llm_router=llm_router, user_model=user_model
+        )
+        if llm_response is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
@@ -242,7 +412,7 @@ async def chat_completion_pass_through_endpoint(  # noqa: PLR0915
         response_cost = hidden_params.get("response_cost", None) or ""
 
         ### ALERTING ###
-        asyncio.create_task(
+        _create_background_task(
             proxy_logging_obj.update_request_status(
                 litellm_call_id=data.get("litellm_call_id", ""), status="success"
             )
@@ -261,7 +431,7 @@ async def chat_completion_pass_through_endpoint(  # noqa: PLR0915
             )
         )
 
-        verbose_proxy_logger.info("\nResponse from Litellm:\n{}".format(response))
+        verbose_proxy_logger.info("\nResponse from Litellm:\n%s", response)
         return response
     except Exception as e:
         await proxy_logging_obj.post_call_failure_hook(
@@ -288,12 +458,11 @@ class HttpPassThroughEndpointHelpers(BasePassthroughUtils):
         litellm_call_id: Optional[str] = None,
         custom_headers: Optional[dict] = None,
     ) -> dict:
-        excluded_headers = {"transfer-encoding", "content-encoding"}
-
+        # httpx already normalizes header names to lowercase in .items()
         return_headers = {
             key: value
             for key, value in headers.items()
-            if key.lower() not in excluded_headers
+            if key not in _EXCLUDED_RESPONSE_HEADERS
         }
         if litellm_call_id:
             return_headers["x-litellm-call-id"] = litellm_call_id
@@ -305,15 +474,13 @@ class HttpPassThroughEndpointHelpers(BasePassthroughUtils):
     @staticmethod
     def get_endpoint_type(url: str) -> EndpointType:
         parsed_url = urlparse(url)
-        if (
-            ("generateContent") in url
-            or ("streamGenerateContent") in url
-            or ("rawPredict") in url
-            or ("streamRawPredict") in url
-        ):
-            return EndpointType.VERTEX_AI
-        elif parsed_url.hostname == "api.anthropic.com":
+        if parsed_url.hostname == "api.anthropic.com":
             return EndpointType.ANTHROPIC
+        # only scan the path - the vertex tokens never appear in the
+        # hostname or query string
+        path = parsed_url.path
+        if any(token in path for token in _VERTEX_PATH_TOKENS):
+            return EndpointType.VERTEX_AI
         return EndpointType.GENERIC
 
     @staticmethod
@@ -395,10 +562,15 @@ class HttpPassThroughEndpointHelpers(BasePassthroughUtils):
     @staticmethod
     async def _build_request_files_from_upload_file(
         upload_file: Union[UploadFile, StarletteUploadFile],
-    ) -> Tuple[Optional[str], bytes, Optional[str]]:
-        """Build a request files dict from an UploadFile object"""
-        file_content = await upload_file.read()
-        return (upload_file.filename, file_content, upload_file.content_type)
+    ) -> Tuple[Optional[str], Any, Optional[str]]:
+        """
+        Build a request files tuple from an UploadFile object
+
+        Hands httpx the underlying spooled file object so the upload is
+        streamed in chunks instead of buffered fully into memory
+        """
+        await upload_file.seek(0)
+        return (upload_file.filename, upload_file.file, upload_file.content_type)
 
     @staticmethod
     async def make_multipart_http_request(
@@ -445,14 +617,11 @@ class HttpPassThroughEndpointHelpers(BasePassthroughUtils):
         """
         Filter out litellm params from the request body
         """
-        from litellm.types.utils import all_litellm_params
-
         _parsed_body = _parsed_body or {}
 
-        litellm_params_in_body = {}
-        for k in all_litellm_params:
-            if k in _parsed_body:
-                litellm_params_in_body[k] = _parsed_body.pop(k, None)
+        litellm_params_in_body = {
+            k: _parsed_body.pop(k) for k in _parsed_body.keys() & _ALL_LITELLM_PARAMS
+        }
 
         _metadata = dict(
             StandardLoggingUserAPIKeyMetadata(
@@ -489,7 +658,9 @@ class HttpPassThroughEndpointHelpers(BasePassthroughUtils):
                 "proxy_server_request": {
                     "url": str(request.url),
                     "method": request.method,
-                    "body": copy.copy(_parsed_body),  # use copy instead of deepcopy
+                    # safe to store by reference - downstream loggers treat
+                    # the request body as read-only
+                    "body": _parsed_body,
                 },
             },
             "call_type": "pass_through_endpoint",
@@ -568,6 +739,7 @@ async def pass_through_request(  # noqa: PLR0915
     #########################################################
     litellm_call_id = str(uuid.uuid4())
     url: Optional[httpx.URL] = None
+    url_str: Optional[str] = None
 
     # parsed request body
     _parsed_body: Optional[dict] = None
@@ -578,11 +750,14 @@ async def pass_through_request(  # noqa: PLR0915
     try:
         url = httpx.URL(target)
         headers = custom_headers
-        headers = HttpPassThroughEndpointHelpers.forward_headers_from_request(
-            request_headers=dict(request.headers),
-            headers=headers,
-            forward_headers=forward_headers,
-        )
+        if forward_headers is True:
+            # only materialize the request headers when they are actually
+            # being forwarded
+            headers = HttpPassThroughEndpointHelpers.forward_headers_from_request(
+                request_headers=dict(request.headers),
+                headers=headers,
+                forward_headers=forward_headers,
+            )
 
         if merge_query_params:
             # Create a new URL with the merged query params
@@ -595,8 +770,12 @@ async def pass_through_request(  # noqa: PLR0915
                 ).encode("ascii")
             )
 
+        # serialize the URL once - httpx.URL.__str__ rebuilds the string on
+        # every call
+        url_str = str(url)
+
         endpoint_type: EndpointType = HttpPassThroughEndpointHelpers.get_endpoint_type(
-            str(url)
+            url_str
         )
 
         if custom_body:
@@ -604,9 +783,10 @@ async def pass_through_request(  # noqa: PLR0915
         else:
             _parsed_body = await _read_request_body(request)
         verbose_proxy_logger.debug(
-            "Pass through endpoint sending request to \nURL {}\nheaders: {}\nbody: {}\n".format(
-                url, headers, _parsed_body
-            )
+            "Pass through endpoint sending request to \nURL %s\nheaders: %s\nbody: %s\n",
+            url,
+            headers,
+            _parsed_body,
         )
 
         ### CALL HOOKS ### - modify incoming data / reject request before calling the model
@@ -615,29 +795,31 @@ async def pass_through_request(  # noqa: PLR0915
             data=_parsed_body,
             call_type="pass_through_endpoint",
         )
-        async_client_obj = get_async_httpx_client(
-            llm_provider=httpxSpecialProvider.PassThroughEndpoint,
-            params={"timeout": 600},
-        )
-        async_client = async_client_obj.client
+        async_client = await get_pass_through_async_client()
 
         # create logging object
         start_time = datetime.now()
+        start_time_monotonic = time.monotonic()
+        # serialize the body once - reused for both the Logging object and
+        # the pre_call input below
+        _body_str = safe_dumps(_parsed_body)
         logging_obj = Logging(
             model="unknown",
-            messages=[{"role": "user", "content": safe_dumps(_parsed_body)}],
+            messages=[{"role": "user", "content": _body_str}],
             stream=False,
             call_type="pass_through_endpoint",
             start_time=start_time,
             litellm_call_id=litellm_call_id,
             function_id="1245",
         )
-        passthrough_logging_payload = PassthroughStandardLoggingPayload(
-            url=str(url),
-            request_body=_parsed_body,
-            request_method=getattr(request, "method", None),
-            cost_per_request=cost_per_request,
-        )
+        # PassthroughStandardLoggingPayload is a TypedDict - build it as a
+        # plain dict literal to skip the constructor call
+        passthrough_logging_payload: PassthroughStandardLoggingPayload = {
+            "url": url_str,
+            "request_body": _parsed_body,
+            "request_method": getattr(request, "method", None),
+            "cost_per_request": cost_per_request,
+        }
         kwargs = HttpPassThroughEndpointHelpers._init_kwargs_for_pass_through_endpoint(
             user_api_key_dict=user_api_key_dict,
             _parsed_body=_parsed_body,
@@ -658,27 +840,20 @@ async def pass_through_request(  # noqa: PLR0915
         logging_obj.model_call_details["litellm_call_id"] = litellm_call_id
 
         # combine url with query params for logging
-        requested_query_params: Optional[dict] = (
-            query_params or request.query_params.__dict__
-        )
-        if requested_query_params == request.query_params.__dict__:
+        _request_query_params = request.query_params.__dict__
+        requested_query_params: Optional[dict] = query_params or _request_query_params
+        if requested_query_params == _request_query_params:
             requested_query_params = None
 
-        requested_query_params_str = None
+        logging_url = url_str
         if requested_query_params:
-            requested_query_params_str = "&".join(
-                f"{k}={v}" for k, v in requested_query_params.items()
-            )
-
-        logging_url = str(url)
-        if requested_query_params_str:
-            if "?" in str(url):
-                logging_url = str(url) + "&" + requested_query_params_str
-            else:
-                logging_url = str(url) + "?" + requested_query_params_str
+            requested_query_params_str = urlencode(requested_query_params)
+            logging_url += (
+                "&" if "?" in logging_url else "?"
+            ) + requested_query_params_str
 
         logging_obj.pre_call(
-            input=[{"role": "user", "content": safe_dumps(_parsed_body)}],
+            input=[{"role": "user", "content": _body_str}],
             api_key="",
             additional_args={
                 "complete_input_dict": _parsed_body,
@@ -712,22 +887,23 @@ async def pass_through_request(  # noqa: PLR0915
                     endpoint_type=endpoint_type,
                     start_time=start_time,
                     passthrough_success_handler_obj=pass_through_endpoint_logging,
-                    url_route=str(url),
+                    url_route=url_str,
                 ),
                 headers=HttpPassThroughEndpointHelpers.get_response_headers(
                     headers=response.headers,
                     litellm_call_id=litellm_call_id,
+                    # tell nginx-style reverse proxies not to re-buffer the
+                    # stream
+                    custom_headers={"x-accel-buffering": "no"},
                 ),
                 status_code=response.status_code,
             )
 
-        verbose_proxy_logger.debug("request method: {}".format(request.method))
-        verbose_proxy_logger.debug("request url: {}".format(url))
-        verbose_proxy_logger.debug("request headers: {}".format(headers))
-        verbose_proxy_logger.debug(
-            "requested_query_params={}".format(requested_query_params)
-        )
-        verbose_proxy_logger.debug("request body: {}".format(_parsed_body))
+        verbose_proxy_logger.debug("request method: %s", request.method)
+        verbose_proxy_logger.debug("request url: %s", url)
+        verbose_proxy_logger.debug("request headers: %s", headers)
+        verbose_proxy_logger.debug("requested_query_params=%s", requested_query_params)
+        verbose_proxy_logger.debug("request body: %s", _parsed_body)
 
         response = (
             await HttpPassThroughEndpointHelpers.non_streaming_http_request_handler(
@@ -757,11 +933,14 @@ async def pass_through_request(  # noqa: PLR0915
                     endpoint_type=endpoint_type,
                     start_time=start_time,
                     passthrough_success_handler_obj=pass_through_endpoint_logging,
-                    url_route=str(url),
+                    url_route=url_str,
                 ),
                 headers=HttpPassThroughEndpointHelpers.get_response_headers(
                     headers=response.headers,
                     litellm_call_id=litellm_call_id,
+                    # tell nginx-style reverse proxies not to re-buffer the
+                    # stream
+                    custom_headers={"x-accel-buffering": "no"},
                 ),
                 status_code=response.status_code,
             )
@@ -779,14 +958,22 @@ async def pass_through_request(  # noqa: PLR0915
         content = await response.aread()
 
         ## LOG SUCCESS
-        response_body: Optional[dict] = get_response_body(response)
+        # only attempt a JSON parse when the upstream says the body is JSON -
+        # pass-through responses can be binary (images, audio, etc.)
+        response_body: Optional[dict] = None
+        if response.headers.get("content-type", "").startswith("application/json"):
+            response_body = get_response_body(response)
         passthrough_logging_payload["response_body"] = response_body
-        end_time = datetime.now()
-        asyncio.create_task(
+        # derive end_time from the monotonic clock so the logged duration is
+        # immune to wall-clock jumps
+        end_time = start_time + timedelta(
+            seconds=time.monotonic() - start_time_monotonic
+        )
+        _create_background_task(
             pass_through_endpoint_logging.pass_through_async_success_handler(
                 httpx_response=response,
                 response_body=response_body,
-                url_route=str(url),
+                url_route=url_str,
                 result="",
                 start_time=start_time,
                 end_time=end_time,
@@ -803,7 +990,9 @@ async def pass_through_request(  # noqa: PLR0915
             call_id=litellm_call_id,
             model_id=None,
             cache_key=None,
-            api_base=str(url._uri_reference),
+            # url_str is the same serialized reference - get_custom_headers
+            # strips the query string itself
+            api_base=url_str,
         )
 
         return Response(
@@ -815,17 +1004,19 @@ async def pass_through_request(  # noqa: PLR0915
             ),
         )
     except Exception as e:
+        if url_str is None and url is not None:
+            # the exception fired before the URL was serialized
+            url_str = str(url)
         custom_headers = ProxyBaseLLMRequestProcessing.get_custom_headers(
             user_api_key_dict=user_api_key_dict,
             call_id=litellm_call_id,
             model_id=None,
             cache_key=None,
-            api_base=str(url._uri_reference) if url else None,
+            api_base=url_str,
         )
         verbose_proxy_logger.exception(
-            "litellm.proxy.proxy_server.pass_through_endpoint(): Exception occured - {}".format(
-                str(e)
-            )
+            "litellm.proxy.proxy_server.pass_through_endpoint(): Exception occured - %s",
+            e,
         )
 
         #########################################################
@@ -833,38 +1024,41 @@ async def pass_through_request(  # noqa: PLR0915
         # for pass through endpoint failure
         #########################################################
         request_payload: dict = _parsed_body or {}
-        # add user_api_key_dict, litellm_call_id, passthrough_logging_payloa for logging
+        # add user_api_key_dict, litellm_call_id, passthrough_logging_payload for logging
         if kwargs:
-            for key, value in kwargs.items():
-                request_payload[key] = value
+            request_payload.update(kwargs)
+        # traceback_str is only read by custom-logger failure callbacks -
+        # skip walking + formatting the frame chain when none are registered
+        traceback_str: Optional[str] = None
+        if litellm.callbacks:
+            traceback_str = traceback.format_exc(
+                limit=MAXIMUM_TRACEBACK_LINES_TO_LOG,
+            )
         await proxy_logging_obj.post_call_failure_hook(
             user_api_key_dict=user_api_key_dict,
             original_exception=e,
             request_data=request_payload,
-            traceback_str=traceback.format_exc(
-                limit=MAXIMUM_TRACEBACK_LINES_TO_LOG,
-            ),
+            traceback_str=traceback_str,
         )
 
         #########################################################
 
         if isinstance(e, HTTPException):
-            raise ProxyException(
-                message=getattr(e, "message", str(e.detail)),
-                type=getattr(e, "type", "None"),
-                param=getattr(e, "param", "None"),
-                code=getattr(e, "status_code", status.HTTP_400_BAD_REQUEST),
-                headers=custom_headers,
-            )
+            default_message = str(e.detail)
+            default_code: int = status.HTTP_400_BAD_REQUEST
         else:
-            error_msg = f"{str(e)}"
-            raise ProxyException(
-                message=getattr(e, "message", error_msg),
-                type=getattr(e, "type", "None"),
-                param=getattr(e, "param", "None"),
-                code=getattr(e, "status_code", 500),
-                headers=custom_headers,
-            )
+            default_message = str(e)
+            default_code = 500
+        raise ProxyException(
+            message=getattr(e, "message", default_message),
+            type=getattr(e, "type", "None"),
+            param=getattr(e, "param", "None"),
+            code=getattr(e, "status_code", default_code),
+            headers=custom_headers,
+        )
+
+
+_TAGS_NOT_SET = object()
 
 
 def _update_metadata_with_tags_in_header(request: Request, metadata: dict) -> dict:
@@ -872,13 +1066,106 @@ def _update_metadata_with_tags_in_header(request: Request, metadata: dict) -> di
     If tags are in the request headers, add them to the metadata
 
     Used for google and vertex JS SDKs
+
+    The split result is memoized on `request.state`, so other consumers of the
+    same request skip the linear header scan and re-split.
     """
-    _tags = request.headers.get("tags")
+    _state = getattr(request, "state", None)
+    _tags = getattr(_state, "_tags_split", _TAGS_NOT_SET)
+    if _tags is _TAGS_NOT_SET:
+        _raw_tags = request.headers.get("tags")
+        _tags = [t for t in _raw_tags.split(",") if t] if _raw_tags else None
+        if _state is not None:
+            _state._tags_split = _tags
     if _tags:
-        metadata["tags"] = _tags.split(",")
+        metadata["tags"] = _tags
     return metadata
 
 
+class _PassThroughRouteConfig(NamedTuple):
+    """Immutable per-route parameters captured by the URL endpoint closure"""
+
+    target: str
+    custom_headers: dict
+    forward_headers: Optional[bool]
+    merge_query_params: Optional[bool]
+    include_subpath: Optional[bool]
+    cost_per_request: Optional[float]
+
+
+@lru_cache(maxsize=512)
+def _cached_url_endpoint_func(
+    target: str,
+    custom_headers_tuple: Optional[Tuple[Tuple[str, str], ...]],
+    forward_headers: Optional[bool],
+    merge_query_params: Optional[bool],
+    include_subpath: Optional[bool],
+    cost_per_request: Optional[float],
+):
+    """
+    Build (and memoize) the endpoint closure for a URL target.
+
+    create_pass_through_route runs per request on the provider pass-through
+    routes, so repeated calls with the same target/headers reuse one closure
+    instead of rebuilding it each time.
+    """
+    cfg = _PassThroughRouteConfig(
+        target=target,
+        custom_headers=dict(custom_headers_tuple) if custom_headers_tuple else {},
+        forward_headers=forward_headers,
+        merge_query_params=merge_query_params,
+        include_subpath=include_subpath,
+        cost_per_request=cost_per_request,
+    )
+
+    async def endpoint_func(  # type: ignore
+        request: Request,
+        fastapi_response: Response,
+        user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
+        query_params: Optional[dict] = None,
+        custom_body: Optional[dict] = None,
+        stream: Optional[
+            bool
+        ] = None,  # if pass-through endpoint is a streaming request
+        subpath: str = "",  # captures sub-paths when include_subpath=True
+    ):
+        # single cell lookup for the route config instead of one per
+        # captured parameter
+        (
+            target,
+            custom_headers,
+            forward_headers,
+            merge_query_params,
+            include_subpath,
+            cost_per_request,
+        ) = cfg
+
+        # Construct the full target URL with subpath if needed
+        full_target = HttpPassThroughEndpointHelpers.construct_target_url_with_subpath(
+            base_target=target, subpath=subpath, include_subpath=include_subpath
+        )
+
+        return await pass_through_request(  # type: ignore
+            request=request,
+            target=full_target,
+            custom_headers=custom_headers,
+            user_api_key_dict=user_api_key_dict,
+            forward_headers=forward_headers,
+            merge_query_params=merge_query_params,
+            query_params=query_params,
+            stream=stream,
+            custom_body=custom_body,
+            cost_per_request=cost_per_request,
+        )
+
+    return endpoint_func
+
+
+def _looks_like_url(target: str) -> bool:
+    """True when the pass-through target is a URL rather than an adapter reference"""
+    return target.startswith(("http://", "https://", "ws://", "wss://"))
+
+
 def create_pass_through_route(
     endpoint,
     target: str,
@@ -890,15 +1177,17 @@ def create_pass_through_route(
     cost_per_request: Optional[float] = None,
 ):
     # check if target is an adapter.py or a url
-    import uuid
-
-    from litellm.proxy.types_utils.utils import get_instance_fn
-
-    try:
-        if isinstance(target, CustomLogger):
-            adapter = target
-        else:
+    adapter: Optional[CustomLogger] = None
+    if isinstance(target, CustomLogger):
+        adapter = target
+    elif isinstance(target, str) and not _looks_like_url(target):
+        # target is an import-path reference to an adapter instance
+        try:
             adapter = get_instance_fn(value=target)
+        except Exception:
+            verbose_proxy_logger.debug("Defaulting to target being a url.")
+
+    if adapter is not None:
         adapter_id = str(uuid.uuid4())
         litellm.adapters = [{"id": adapter_id, "adapter": adapter}]
 
@@ -915,41 +1204,18 @@ def create_pass_through_route(
                 user_api_key_dict=user_api_key_dict,
             )
 
-    except Exception:
-        verbose_proxy_logger.debug("Defaulting to target being a url.")
-
-        async def endpoint_func(  # type: ignore
-            request: Request,
-            fastapi_response: Response,
-            user_api_key_dict: UserAPIKeyAuth = Depends(user_api_key_auth),
-            query_params: Optional[dict] = None,
-            custom_body: Optional[dict] = None,
-            stream: Optional[
-                bool
-            ] = None,  # if pass-through endpoint is a streaming request
-            subpath: str = "",  # captures sub-paths when include_subpath=True
-        ):
-            # Construct the full target URL with subpath if needed
-            full_target = (
-                HttpPassThroughEndpointHelpers.construct_target_url_with_subpath(
-                    base_target=target, subpath=subpath, include_subpath=include_subpath
-                )
-            )
-
-            return await pass_through_request(  # type: ignore
-                request=request,
-                target=full_target,
-                custom_headers=custom_headers or {},
-                user_api_key_dict=user_api_key_dict,
-                forward_headers=_forward_headers,
-                merge_query_params=_merge_query_params,
-                query_params=query_params,
-                stream=stream,
-                custom_body=custom_body,
-                cost_per_request=cost_per_request,
-            )
-
-    return endpoint_func
+        return endpoint_func
+
+    return _cached_url_endpoint_func(
+        target=target,
+        custom_headers_tuple=(
+            tuple(sorted(custom_headers.items())) if custom_headers else None
+        ),
+        forward_headers=_forward_headers,
+        merge_query_params=_merge_query_params,
+        include_subpath=include_subpath,
+        cost_per_request=cost_per_request,
+    )
 
 
 def _is_streaming_response(response: httpx.Response) -> bool:
@@ -961,8 +1227,8 @@ def _is_streaming_response(response: httpx.Response) -> bool:
 
 class InitPassThroughEndpointHelpers:
     @staticmethod
-    def add_exact_path_route(
-        app: FastAPI,
+    def add_route(
+        app: Union[FastAPI, APIRouter],
         path: str,
         target: str,
         custom_headers: Optional[dict],
@@ -970,63 +1236,48 @@ class InitPassThroughEndpointHelpers:
         merge_query_params: Optional[bool],
         dependencies: Optional[List],
         cost_per_request: Optional[float],
+        include_subpath: bool = False,
     ):
-        """Add exact path route for pass-through endpoint"""
+        """
+        Add the route(s) for a pass-through endpoint.
+
+        When `include_subpath` is True the exact path and a `/{subpath:path}`
+        wildcard are registered, sharing a single endpoint closure. The `/`
+        separator in the wildcard is load-bearing: a bare `{path}{subpath}`
+        pattern would also match sibling paths like `{path}2`, forwarding
+        their traffic to this endpoint's target and credentials.
+        """
         verbose_proxy_logger.debug(
-            "adding exact pass through endpoint: %s, dependencies: %s",
+            "adding pass through endpoint: %s (include_subpath=%s), dependencies: %s",
             path,
+            include_subpath,
             dependencies,
         )
 
-        app.add_api_route(
-            path=path,
-            endpoint=create_pass_through_route(  # type: ignore
-                path,
-                target,
-                custom_headers,
-                forward_headers,
-                merge_query_params,
-                dependencies,
-                cost_per_request=cost_per_request,
-            ),
-            methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
-            dependencies=dependencies,
-        )
-
-    @staticmethod
-    def add_subpath_route(
-        app: FastAPI,
-        path: str,
-        target: str,
-        custom_headers: Optional[dict],
-        forward_headers: Optional[bool],
-        merge_query_params: Optional[bool],
-        dependencies: Optional[List],
-        cost_per_request: Optional[float],
-    ):
-        """Add wildcard route for sub-paths"""
-        wildcard_path = f"{path}/{{subpath:path}}"
-        verbose_proxy_logger.debug(
-            "adding wildcard pass through endpoint: %s, dependencies: %s",
-            wildcard_path,
+        endpoint = create_pass_through_route(  # type: ignore
+            path,
+            target,
+            custom_headers,
+            forward_headers,
+            merge_query_params,
             dependencies,
+            include_subpath=include_subpath,
+            cost_per_request=cost_per_request,
         )
 
         app.add_api_route(
-            path=wildcard_path,
-            endpoint=create_pass_through_route(  # type: ignore
-                path,
-                target,
-                custom_headers,
-                forward_headers,
-                merge_query_params,
-                dependencies,
-                include_subpath=True,
-                cost_per_request=cost_per_request,
-            ),
+            path=path,
+            endpoint=endpoint,
             methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
             dependencies=dependencies,
         )
+        if include_subpath:
+            app.add_api_route(
+                path=f"{path}/{{subpath:path}}",
+                endpoint=endpoint,
+                methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+                dependencies=dependencies,
+            )
 
 
 async def initialize_pass_through_endpoints(
@@ -1041,31 +1292,46 @@ async def initialize_pass_through_endpoints(
     Returns:
         None
     """
-    import uuid
-
     verbose_proxy_logger.debug("initializing pass through endpoints")
-    from litellm.proxy._types import CommonProxyErrors, LiteLLMRoutes
     from litellm.proxy.proxy_server import app, premium_user
 
+    # collect routes on a dedicated sub-router and mount it once, instead of
+    # touching the app's route table per endpoint
+    passthrough_router = APIRouter()
+
     for endpoint in pass_through_endpoints:
         if isinstance(endpoint, PassThroughGenericEndpoint):
-            endpoint = endpoint.model_dump()
-
-        # Auto-generate ID for backwards compatibility if not present
-        if endpoint.get("id") is None:
-            endpoint["id"] = str(uuid.uuid4())
+            # already-validated config (e.g. loaded from the db) - read fields
+            # via attribute access instead of round-tripping through a dict
+            if endpoint.id is None:
+                # Auto-generate ID for backwards compatibility if not present
+                endpoint.id = str(uuid.uuid4())
+            _endpoint_id: Optional[str] = endpoint.id
+            _target: Optional[str] = endpoint.target
+            _path: Optional[str] = endpoint.path
+            _custom_headers: Optional[dict] = endpoint.headers
+            _forward_headers = getattr(endpoint, "forward_headers", None)
+            _merge_query_params = getattr(endpoint, "merge_query_params", None)
+            _auth = getattr(endpoint, "auth", None)
+            _include_subpath = endpoint.include_subpath
+            _cost_per_request: Optional[float] = endpoint.cost_per_request
+        else:
+            # Auto-generate ID for backwards compatibility if not present
+            if endpoint.get("id") is None:
+                endpoint["id"] = str(uuid.uuid4())
+            _endpoint_id = endpoint.get("id")
+            _target = endpoint.get("target", None)
+            _path = endpoint.get("path", None)
+            _custom_headers = endpoint.get("headers", None)
+            _forward_headers = endpoint.get("forward_headers", None)
+            _merge_query_params = endpoint.get("merge_query_params", None)
+            _auth = endpoint.get("auth", None)
+            _include_subpath = endpoint.get("include_subpath", False)
+            _cost_per_request = endpoint.get("cost_per_request", None)
 
-        _target = endpoint.get("target", None)
-        _path: Optional[str] = endpoint.get("path", None)
         if _path is None:
             raise ValueError("Path is required for pass-through endpoint")
-        _custom_headers = endpoint.get("headers", None)
-        _custom_headers = await set_env_variables_in_header(
-            custom_headers=_custom_headers
-        )
-        _forward_headers = endpoint.get("forward_headers", None)
-        _merge_query_params = endpoint.get("merge_query_params", None)
-        _auth = endpoint.get("auth", None)
+        _custom_headers = set_env_variables_in_header(custom_headers=_custom_headers)
         _dependencies = None
         if _auth is not None and str(_auth).lower() == "true":
             if premium_user is not True:
@@ -1075,43 +1341,37 @@ async def initialize_pass_through_endpoints(
                     )
                 )
             _dependencies = [Depends(user_api_key_auth)]
-            LiteLLMRoutes.openai_routes.value.append(_path)
+            # guard against duplicate entries on re-initialization - the auth
+            # path keeps a set view of this list for O(1) membership checks
+            if _path not in LiteLLMRoutes.openai_routes.value:
+                LiteLLMRoutes.openai_routes.value.append(_path)
 
         if _target is None:
             continue
 
-        # Add exact path route
+        # Add the route (a single wildcard route covers sub-paths too)
         verbose_proxy_logger.debug(
-            "Initializing pass through endpoint: %s (ID: %s)", _path, endpoint.get("id")
+            "Initializing pass through endpoint: %s (ID: %s)", _path, _endpoint_id
         )
-        InitPassThroughEndpointHelpers.add_exact_path_route(
-            app=app,
+        InitPassThroughEndpointHelpers.add_route(
+            app=passthrough_router,
             path=_path,
             target=_target,
             custom_headers=_custom_headers,
             forward_headers=_forward_headers,
             merge_query_params=_merge_query_params,
             dependencies=_dependencies,
-            cost_per_request=endpoint.get("cost_per_request", None),
+            cost_per_request=_cost_per_request,
+            include_subpath=_include_subpath is True,
         )
 
-        # Add wildcard route for sub-paths
-        if endpoint.get("include_subpath", False) is True:
-            InitPassThroughEndpointHelpers.add_subpath_route(
-                app=app,
-                path=_path,
-                target=_target,
-                custom_headers=_custom_headers,
-                forward_headers=_forward_headers,
-                merge_query_params=_merge_query_params,
-                dependencies=_dependencies,
-                cost_per_request=endpoint.get("cost_per_request", None),
-            )
-
         verbose_proxy_logger.debug(
-            "Added new pass through endpoint: %s (ID: %s)", _path, endpoint.get("id")
+            "Added new pass through endpoint: %s (ID: %s)", _path, _endpoint_id
         )
 
+    if passthrough_router.routes:
+        app.include_router(passthrough_router)
+
 
 async def _get_pass_through_endpoints_from_db(
     endpoint_id: Optional[str] = None,
@@ -1151,6 +1411,7 @@ async def _get_pass_through_endpoints_from_db(
     "/config/pass_through_endpoint",
     dependencies=[Depends(user_api_key_auth)],
     response_model=PassThroughEndpointResponse,
+    response_class=ORJSONResponse,
 )
 async def get_pass_through_endpoints(
     endpoint_id: Optional[str] = None,
@@ -1160,16 +1421,46 @@ async def get_pass_through_endpoints(
     GET configured pass through endpoint.
 
     If no endpoint_id given, return all configured endpoints.
-    """  ## Get existing pass-through endpoint field value
-    pass_through_endpoints = await _get_pass_through_endpoints_from_db(
-        endpoint_id=endpoint_id, user_api_key_dict=user_api_key_dict
-    )
-    return PassThroughEndpointResponse(endpoints=pass_through_endpoints)
+    """
+    from litellm.proxy.proxy_server import get_config_general_settings
+
+    ## Get existing pass-through endpoint field value
+    try:
+        response: ConfigFieldInfo = await get_config_general_settings(
+            field_name="pass_through_endpoints", user_api_key_dict=user_api_key_dict
+        )
+        pass_through_endpoint_data: Optional[List] = response.field_value
+    except Exception:
+        pass_through_endpoint_data = None
+
+    if pass_through_endpoint_data is None:
+        return ORJSONResponse(content={"endpoints": []})
+
+    if endpoint_id is None:
+        entries = pass_through_endpoint_data
+    else:
+        idx = _find_endpoint_index_by_id(pass_through_endpoint_data, endpoint_id)
+        entries = [] if idx is None else [pass_through_endpoint_data[idx]]
+
+    # validate stored dicts once here - entries set via config.yaml or the
+    # generic config-update path never went through the response model, so
+    # skipping validation would change the advertised API shape. Returning a
+    # Response still skips FastAPI's second validation/serialization pass.
+    endpoints = [
+        (
+            endpoint
+            if isinstance(endpoint, PassThroughGenericEndpoint)
+            else PassThroughGenericEndpoint(**endpoint)
+        ).model_dump()
+        for endpoint in entries
+    ]
+    return ORJSONResponse(content={"endpoints": endpoints})
 
 
 @router.post(
     "/config/pass_through_endpoint/{endpoint_id}",
     dependencies=[Depends(user_api_key_auth)],
+    response_class=ORJSONResponse,
 )
 async def update_pass_through_endpoints(
     endpoint_id: str,
@@ -1179,95 +1470,174 @@ async def update_pass_through_endpoints(
     """
     Update a pass-through endpoint by ID.
     """
-    from litellm.proxy.proxy_server import (
-        get_config_general_settings,
-        update_config_general_settings,
+    updated_endpoint: Optional[PassThroughGenericEndpoint] = None
+
+    def _apply_update(current: Optional[List]) -> List:
+        nonlocal updated_endpoint
+        if current is None:
+            raise HTTPException(
+                status_code=404,
+                detail={"error": "No pass-through endpoints found"},
+            )
+
+        # Find the endpoint to update
+        endpoint_index = _find_endpoint_index_by_id(current, endpoint_id)
+        if endpoint_index is None:
+            raise HTTPException(
+                status_code=404,
+                detail={"error": f"Endpoint with ID '{endpoint_id}' not found"},
+            )
+
+        # Start with the raw stored entry - no need to validate it just to merge
+        found_endpoint = current[endpoint_index]
+        if isinstance(found_endpoint, dict):
+            endpoint_dict = dict(found_endpoint)
+        else:
+            endpoint_dict = found_endpoint.model_dump()
+
+        # Update with new data, excluding None values for partial updates
+        update_data = data.model_dump(exclude_none=True)
+        existing_id = endpoint_dict.get("id")
+        endpoint_dict.update(update_data)
+
+        # Preserve existing ID if not provided in update and endpoint has ID
+        if "id" not in update_data and existing_id is not None:
+            endpoint_dict["id"] = existing_id
+
+        # Validate the merged result once, for the response
+        updated_endpoint = PassThroughGenericEndpoint(**endpoint_dict)
+
+        # Update the list
+        current[endpoint_index] = endpoint_dict
+        return current
+
+    ## Update db (coalesced with any concurrent config writes)
+    await _pass_through_config_writer.mutate(
+        mutator=_apply_update, user_api_key_dict=user_api_key_dict
     )
 
-    ## Get existing pass-through endpoint field value
-    try:
-        response: ConfigFieldInfo = await get_config_general_settings(
-            field_name="pass_through_endpoints", user_api_key_dict=user_api_key_dict
-        )
-    except Exception:
-        raise HTTPException(
-            status_code=404,
-            detail={"error": "No pass-through endpoints found"},
-        )
+    return PassThroughEndpointResponse(
+        endpoints=[updated_endpoint] if updated_endpoint else []
+    )
 
-    pass_through_endpoint_data: Optional[List] = response.field_value
-    if pass_through_endpoint_data is None:
-        raise HTTPException(
-            status_code=404,
-            detail={"error": "No pass-through endpoints found"},
-        )
 
-    # Find the endpoint to update
-    found_endpoint = _find_endpoint_by_id(pass_through_endpoint_data, endpoint_id)
+class _PassThroughConfigWriter:
+    """
+    Coalesces pass-through endpoint config writes into a single
+    `update_config_general_settings` call per burst.
 
-    if found_endpoint is None:
-        raise HTTPException(
-            status_code=404,
-            detail={"error": f"Endpoint with ID '{endpoint_id}' not found"},
-        )
+    Mutations are applied in order under a lock against the most recent
+    pending value, so concurrent create/update/delete requests merge instead
+    of clobbering each other's read-modify-write cycle, and bulk provisioning
+    of N endpoints issues one general_settings row update instead of N.
 
-    # Find the index for updating the list
-    endpoint_index = None
-    for idx, endpoint in enumerate(pass_through_endpoint_data):
-        _endpoint = (
-            PassThroughGenericEndpoint(**endpoint)
-            if isinstance(endpoint, dict)
-            else endpoint
-        )
-        if _endpoint.id == endpoint_id:
-            endpoint_index = idx
-            break
-
-    if endpoint_index is None:
-        raise HTTPException(
-            status_code=404,
-            detail={
-                "error": f"Could not find index for endpoint with ID '{endpoint_id}'"
-            },
-        )
+    Coalescing is per-process only: multi-worker deployments still race on
+    the read-modify-write across workers, same as the previous per-request
+    round trips.
+    """
 
-    # Get the update data as dict, excluding None values for partial updates
-    update_data = data.model_dump(exclude_none=True)
+    FLUSH_DELAY_SECONDS = 0.02
 
-    # Start with existing endpoint data
-    endpoint_dict = found_endpoint.model_dump()
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._pending_value: Optional[List] = None
+        self._generation: int = 0
+        self._flush_task: Optional["asyncio.Task"] = None
+        self._flush_future: Optional["asyncio.Future"] = None
+        self._user_api_key_dict: Optional[UserAPIKeyAuth] = None
 
-    # Update with new data (only non-None values)
-    endpoint_dict.update(update_data)
+    async def mutate(
+        self,
+        mutator: Callable[[Optional[List]], List],
+        user_api_key_dict: UserAPIKeyAuth,
+    ) -> None:
+        """
+        Apply `mutator` to the current endpoint list and await the (possibly
+        shared) DB flush.
 
-    # Preserve existing ID if not provided in update and endpoint has ID
-    if "id" not in update_data and found_endpoint.id is not None:
-        endpoint_dict["id"] = found_endpoint.id
+        `mutator` receives the pending in-memory value when a flush is
+        already in flight, otherwise a fresh DB read (None when unset), and
+        may raise to abort without scheduling a write.
+        """
+        from litellm.proxy.proxy_server import get_config_general_settings
 
-    # Create updated endpoint object
-    updated_endpoint = PassThroughGenericEndpoint(**endpoint_dict)
+        async with self._lock:
+            if self._flush_task is not None:
+                current = self._pending_value
+            else:
+                try:
+                    response: ConfigFieldInfo = await get_config_general_settings(
+                        field_name="pass_through_endpoints",
+                        user_api_key_dict=user_api_key_dict,
+                    )
+                    current = response.field_value
+                except Exception:
+                    current = None
+
+            self._pending_value = mutator(current)
+            self._generation += 1
+            self._user_api_key_dict = user_api_key_dict
+            if self._flush_task is None:
+                self._flush_future = asyncio.get_running_loop().create_future()
+                self._flush_task = asyncio.create_task(self._flush())
+            future = self._flush_future
+
+        if future is not None:
+            await future
+
+    async def _flush(self) -> None:
+        from litellm.proxy.proxy_server import update_config_general_settings
+
+        while True:
+            await asyncio.sleep(self.FLUSH_DELAY_SECONDS)
+            async with self._lock:
+                snapshot_value = self._pending_value
+                snapshot_generation = self._generation
+                future = self._flush_future
+                user_api_key_dict = self._user_api_key_dict
+
+            # mutate() always sets this before scheduling the flush
+            assert user_api_key_dict is not None
+            try:
+                await update_config_general_settings(
+                    data=ConfigFieldUpdate(
+                        field_name="pass_through_endpoints",
+                        field_value=snapshot_value,
+                        config_type="general_settings",
+                    ),
+                    user_api_key_dict=user_api_key_dict,
+                )
+            except Exception as e:
+                async with self._lock:
+                    self._reset()
+                if future is not None and not future.done():
+                    future.set_exception(e)
+                return
 
-    # Update the list
-    pass_through_endpoint_data[endpoint_index] = endpoint_dict
+            async with self._lock:
+                flushed_everything = self._generation == snapshot_generation
+                if flushed_everything:
+                    self._reset()
+            if flushed_everything:
+                if future is not None and not future.done():
+                    future.set_result(None)
+                return
+            # new mutations landed while the write was in flight - write again
 
-    ## Update db
-    updated_data = ConfigFieldUpdate(
-        field_name="pass_through_endpoints",
-        field_value=pass_through_endpoint_data,
-        config_type="general_settings",
-    )
-    await update_config_general_settings(
-        data=updated_data, user_api_key_dict=user_api_key_dict
-    )
+    def _reset(self) -> None:
+        self._pending_value = None
+        self._flush_task = None
+        self._flush_future = None
+        self._user_api_key_dict = None
 
-    return PassThroughEndpointResponse(
-        endpoints=[updated_endpoint] if updated_endpoint else []
-    )
+
+_pass_through_config_writer = _PassThroughConfigWriter()
 
 
 @router.post(
     "/config/pass_through_endpoint",
     dependencies=[Depends(user_api_key_auth)],
+    response_class=ORJSONResponse,
 )
 async def create_pass_through_endpoints(
     data: PassThroughGenericEndpoint,
@@ -1276,42 +1646,21 @@ async def create_pass_through_endpoints(
     """
     Create new pass-through endpoint
     """
-    import uuid
-
-    from litellm.proxy.proxy_server import (
-        get_config_general_settings,
-        update_config_general_settings,
-    )
-
-    ## Get existing pass-through endpoint field value
-
-    try:
-        response: ConfigFieldInfo = await get_config_general_settings(
-            field_name="pass_through_endpoints", user_api_key_dict=user_api_key_dict
-        )
-    except Exception:
-        response = ConfigFieldInfo(
-            field_name="pass_through_endpoints", field_value=None
-        )
-
     ## Auto-generate ID if not provided
     data_dict = data.model_dump()
     if data_dict.get("id") is None:
         data_dict["id"] = str(uuid.uuid4())
 
-    if response.field_value is None:
-        response.field_value = [data_dict]
-    elif isinstance(response.field_value, List):
-        response.field_value.append(data_dict)
+    def _append_endpoint(current: Optional[List]) -> List:
+        if current is None:
+            return [data_dict]
+        if isinstance(current, List):
+            current.append(data_dict)
+        return current
 
-    ## Update db
-    updated_data = ConfigFieldUpdate(
-        field_name="pass_through_endpoints",
-        field_value=response.field_value,
-        config_type="general_settings",
-    )
-    await update_config_general_settings(
-        data=updated_data, user_api_key_dict=user_api_key_dict
+    ## Update db (coalesced with any concurrent config writes)
+    await _pass_through_config_writer.mutate(
+        mutator=_append_endpoint, user_api_key_dict=user_api_key_dict
     )
 
     # Return the created endpoint with the generated ID
@@ -1323,6 +1672,7 @@ async def create_pass_through_endpoints(
     "/config/pass_through_endpoint",
     dependencies=[Depends(user_api_key_auth)],
     response_model=PassThroughEndpointResponse,
+    response_class=ORJSONResponse,
 )
 async def delete_pass_through_endpoints(
     endpoint_id: str,
@@ -1333,78 +1683,79 @@ async def delete_pass_through_endpoints(
 
     Returns - the deleted endpoint
     """
-    from litellm.proxy.proxy_server import (
-        get_config_general_settings,
-        update_config_general_settings,
+    response_obj: Optional[PassThroughGenericEndpoint] = None
+
+    def _remove_endpoint(current: Optional[List]) -> List:
+        nonlocal response_obj
+        if current is None:
+            raise HTTPException(
+                status_code=400,
+                detail={"error": "There are no pass-through endpoints setup."},
+            )
+
+        # Find the endpoint to delete
+        endpoint_index = _find_endpoint_index_by_id(current, endpoint_id)
+        if endpoint_index is None:
+            raise HTTPException(
+                status_code=400,
+                detail={
+                    "error": "Endpoint with ID '{}' was not found in pass-through endpoint list.".format(
+                        endpoint_id
+                    )
+                },
+            )
+
+        # Remove the endpoint
+        response_obj = _materialize_endpoint(current.pop(endpoint_index))
+        return current
+
+    ## Update db (coalesced with any concurrent config writes)
+    await _pass_through_config_writer.mutate(
+        mutator=_remove_endpoint, user_api_key_dict=user_api_key_dict
     )
 
-    ## Get existing pass-through endpoint field value
+    # the mutator either raised or set response_obj
+    assert response_obj is not None
+    return PassThroughEndpointResponse(endpoints=[response_obj])
 
-    try:
-        response: ConfigFieldInfo = await get_config_general_settings(
-            field_name="pass_through_endpoints", user_api_key_dict=user_api_key_dict
-        )
-    except Exception:
-        response = ConfigFieldInfo(
-            field_name="pass_through_endpoints", field_value=None
-        )
 
-    ## Update field by removing endpoint
-    pass_through_endpoint_data: Optional[List] = response.field_value
-    if response.field_value is None or pass_through_endpoint_data is None:
-        raise HTTPException(
-            status_code=400,
-            detail={"error": "There are no pass-through endpoints setup."},
-        )
+def _materialize_endpoint(
+    endpoint: Union[dict, PassThroughGenericEndpoint],
+) -> PassThroughGenericEndpoint:
+    """Validate a single stored endpoint entry into a PassThroughGenericEndpoint"""
+    if isinstance(endpoint, dict):
+        return PassThroughGenericEndpoint(**endpoint)
+    return endpoint
 
-    # Find the endpoint to delete
-    found_endpoint = _find_endpoint_by_id(pass_through_endpoint_data, endpoint_id)
 
-    if found_endpoint is None:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": "Endpoint with ID '{}' was not found in pass-through endpoint list.".format(
-                    endpoint_id
-                )
-            },
-        )
+def _find_endpoint_index_by_id(
+    endpoints_data: List,
+    endpoint_id: str,
+) -> Optional[int]:
+    """
+    Find the index of an endpoint by ID.
 
-    # Find the index for deleting from the list
-    endpoint_index = None
-    for idx, endpoint in enumerate(pass_through_endpoint_data):
-        _endpoint = (
-            PassThroughGenericEndpoint(**endpoint)
-            if isinstance(endpoint, dict)
-            else endpoint
-        )
-        if _endpoint.id == endpoint_id:
-            endpoint_index = idx
-            break
-
-    if endpoint_index is None:
-        raise HTTPException(
-            status_code=400,
-            detail={
-                "error": f"Could not find index for endpoint with ID '{endpoint_id}'"
-            },
-        )
+    Compares raw ids instead of validating every entry into a
+    PassThroughGenericEndpoint just to read its id.
 
-    # Remove the endpoint
-    pass_through_endpoint_data.pop(endpoint_index)
-    response_obj = found_endpoint
+    Args:
+        endpoints_data: List of endpoint data (dicts or PassThroughGenericEndpoint objects)
+        endpoint_id: ID to search for
 
-    ## Update db
-    updated_data = ConfigFieldUpdate(
-        field_name="pass_through_endpoints",
-        field_value=pass_through_endpoint_data,
-        config_type="general_settings",
-    )
-    await update_config_general_settings(
-        data=updated_data, user_api_key_dict=user_api_key_dict
-    )
+    Returns:
+        Index of the found endpoint or None if not found
+    """
+    for idx, endpoint in enumerate(endpoints_data):
+        if isinstance(endpoint, dict):
+            _id = endpoint.get("id")
+        else:
+            _id = getattr(endpoint, "id", None)
 
-    return PassThroughEndpointResponse(endpoints=[response_obj])
+        # Only compare IDs to IDs
+        if _id is not None and _id == endpoint_id:
+            return idx
+
+    return None
 
 
 def _find_endpoint_by_id(
@@ -1421,18 +1772,10 @@ def _find_endpoint_by_id(
     Returns:
         Found endpoint or None if not found
     """
-    for endpoint in endpoints_data:
-        _endpoint: Optional[PassThroughGenericEndpoint] = None
-        if isinstance(endpoint, dict):
-            _endpoint = PassThroughGenericEndpoint(**endpoint)
-        elif isinstance(endpoint, PassThroughGenericEndpoint):
-            _endpoint = endpoint
-
-        # Only compare IDs to IDs
-        if _endpoint is not None and _endpoint.id == endpoint_id:
-            return _endpoint
-
-    return None
+    idx = _find_endpoint_index_by_id(endpoints_data, endpoint_id)
+    if idx is None:
+        return None
+    return _materialize_endpoint(endpoints_data[idx])
 
 
 async def initialize_pass_through_endpoints_in_db():
@@ -294,6 +294,7 @@ from litellm.proxy.pass_through_endpoints.llm_passthrough_endpoints import (
     router as llm_passthrough_router,
 )
 from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
+    close_pass_through_async_client,
     initialize_pass_through_endpoints,
 )
 from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
@@ -510,6 +511,9 @@ async def proxy_shutdown_event():
     if db_writer_client is not None:
         await db_writer_client.close()
 
+    # close the shared pass-through endpoint httpx client
+    await close_pass_through_async_client()
+
     # flush remaining langfuse logs
     if "langfuse" in litellm.success_callback:
         try:
@@ -49,12 +49,13 @@ async def test_build_request_files_from_upload_file():
     # Create SpooledTemporaryFile with content type headers
     headers = Headers({"content-type": "text/plain"})
     upload_file = UploadFile(file=file, filename="test.txt", headers=headers)
-    upload_file.read = AsyncMock(return_value=file_content)
 
     result = await HttpPassThroughEndpointHelpers._build_request_files_from_upload_file(
         upload_file
     )
-    assert result == ("test.txt", file_content, "text/plain")
+    # the underlying file object is forwarded so httpx can stream it
+    assert result == ("test.txt", file, "text/plain")
+    assert result[1].read() == file_content
 
     # Test with Starlette UploadFile
     file2 = BytesIO(file_content)
@@ -63,12 +64,12 @@ async def test_build_request_files_from_upload_file():
         filename="test2.txt",
         headers=Headers({"content-type": "text/plain"}),
     )
-    starlette_file.read = AsyncMock(return_value=file_content)
 
     result = await HttpPassThroughEndpointHelpers._build_request_files_from_upload_file(
         starlette_file
     )
-    assert result == ("test2.txt", file_content, "text/plain")
+    assert result == ("test2.txt", file2, "text/plain")
+    assert result[1].read() == file_content
 
 
 # Test make_multipart_http_request
@@ -315,9 +316,9 @@ def test_construct_target_url_with_subpath():
     assert result == "http://example.com/api/v1"
 
 
-def test_add_exact_path_route():
+def test_add_route_exact_path():
     """
-    Test that add_exact_path_route correctly adds exact path routes
+    Test that add_route correctly adds exact path routes
     """
     from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
         InitPassThroughEndpointHelpers,
@@ -335,7 +336,7 @@ def test_add_exact_path_route():
     dependencies = []
 
     # Call the function
-    InitPassThroughEndpointHelpers.add_exact_path_route(
+    InitPassThroughEndpointHelpers.add_route(
         app=mock_app,
         path=path,
         target=target,
@@ -356,9 +357,9 @@ def test_add_exact_path_route():
     assert callable(call_args["endpoint"])
 
 
-def test_add_subpath_route():
+def test_add_route_with_subpath():
     """
-    Test that add_subpath_route correctly adds wildcard routes for sub-paths
+    Test that add_route registers the exact path plus a wildcard for sub-paths
     """
     from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
         InitPassThroughEndpointHelpers,
@@ -376,7 +377,7 @@ def test_add_subpath_route():
     dependencies = []
 
     # Call the function
-    InitPassThroughEndpointHelpers.add_subpath_route(
+    InitPassThroughEndpointHelpers.add_route(
         app=mock_app,
         path=path,
         target=target,
@@ -385,18 +386,24 @@ def test_add_subpath_route():
         merge_query_params=merge_query_params,
         dependencies=dependencies,
         cost_per_request=None,
+        include_subpath=True,
     )
 
-    # Verify add_api_route was called with correct parameters
-    mock_app.add_api_route.assert_called_once()
-    call_args = mock_app.add_api_route.call_args[1]
+    # Verify add_api_route was called for the exact path and the wildcard
+    assert mock_app.add_api_route.call_count == 2
+    exact_call_args = mock_app.add_api_route.call_args_list[0][1]
+    wildcard_call_args = mock_app.add_api_route.call_args_list[1][1]
 
-    # Should have wildcard path
-    expected_wildcard_path = f"{path}/{{subpath:path}}"
-    assert call_args["path"] == expected_wildcard_path
-    assert call_args["methods"] == ["GET", "POST", "PUT", "DELETE", "PATCH"]
-    assert call_args["dependencies"] == dependencies
-    assert callable(call_args["endpoint"])
+    assert exact_call_args["path"] == path
+    # the "/" separator keeps sibling paths (e.g. /test/path2) from matching
+    assert wildcard_call_args["path"] == f"{path}/{{subpath:path}}"
+    for call_args in (exact_call_args, wildcard_call_args):
+        assert call_args["methods"] == ["GET", "POST", "PUT", "DELETE", "PATCH"]
+        assert call_args["dependencies"] == dependencies
+        assert callable(call_args["endpoint"])
+
+    # both routes share one endpoint closure
+    assert exact_call_args["endpoint"] is wildcard_call_args["endpoint"]
 
 
 @pytest.mark.asyncio
@@ -408,46 +415,37 @@ async def test_initialize_pass_through_endpoints_with_include_subpath():
         initialize_pass_through_endpoints,
     )
 
-    # Mock the helper functions directly
+    # Mock the helper function directly
     with patch(
-        "litellm.proxy.pass_through_endpoints.pass_through_endpoints.InitPassThroughEndpointHelpers.add_exact_path_route"
-    ) as mock_add_exact_route:
+        "litellm.proxy.pass_through_endpoints.pass_through_endpoints.InitPassThroughEndpointHelpers.add_route"
+    ) as mock_add_route:
         with patch(
-            "litellm.proxy.pass_through_endpoints.pass_through_endpoints.InitPassThroughEndpointHelpers.add_subpath_route"
-        ) as mock_add_subpath_route:
+            "litellm.proxy.proxy_server.premium_user",
+            True,
+        ):
             with patch(
-                "litellm.proxy.proxy_server.premium_user",
-                True,
-            ):
-                with patch(
-                    "litellm.proxy.pass_through_endpoints.pass_through_endpoints.set_env_variables_in_header"
-                ) as mock_set_env:
-                    mock_set_env.return_value = {}
+                "litellm.proxy.pass_through_endpoints.pass_through_endpoints.set_env_variables_in_header"
+            ) as mock_set_env:
+                mock_set_env.return_value = {}
 
-                    # Test endpoint with include_subpath=True
-                    endpoints = [
-                        {
-                            "path": "/test/endpoint",
-                            "target": "http://example.com",
-                            "include_subpath": True,
-                        }
-                    ]
+                # Test endpoint with include_subpath=True
+                endpoints = [
+                    {
+                        "path": "/test/endpoint",
+                        "target": "http://example.com",
+                        "include_subpath": True,
+                    }
+                ]
 
-                    await initialize_pass_through_endpoints(endpoints)
+                await initialize_pass_through_endpoints(endpoints)
 
-                    # Should be called once for exact path and once for subpath
-                    mock_add_exact_route.assert_called_once()
-                    mock_add_subpath_route.assert_called_once()
+                # A single wildcard route covers the exact path and sub-paths
+                mock_add_route.assert_called_once()
 
-                    # Verify exact path route call
-                    exact_call_args = mock_add_exact_route.call_args[1]
-                    assert exact_call_args["path"] == "/test/endpoint"
-                    assert exact_call_args["target"] == "http://example.com"
-
-                    # Verify subpath route call
-                    subpath_call_args = mock_add_subpath_route.call_args[1]
-                    assert subpath_call_args["path"] == "/test/endpoint"
-                    assert subpath_call_args["target"] == "http://example.com"
+                call_args = mock_add_route.call_args[1]
+                assert call_args["path"] == "/test/endpoint"
+                assert call_args["target"] == "http://example.com"
+                assert call_args["include_subpath"] is True
 
 
 @pytest.mark.asyncio
@@ -459,41 +457,37 @@ async def test_initialize_pass_through_endpoints_without_include_subpath():
         initialize_pass_through_endpoints,
     )
 
-    # Mock the helper functions directly
+    # Mock the helper function directly
     with patch(
-        "litellm.proxy.pass_through_endpoints.pass_through_endpoints.InitPassThroughEndpointHelpers.add_exact_path_route"
-    ) as mock_add_exact_route:
+        "litellm.proxy.pass_through_endpoints.pass_through_endpoints.InitPassThroughEndpointHelpers.add_route"
+    ) as mock_add_route:
         with patch(
-            "litellm.proxy.pass_through_endpoints.pass_through_endpoints.InitPassThroughEndpointHelpers.add_subpath_route"
-        ) as mock_add_subpath_route:
+            "litellm.proxy.proxy_server.premium_user",
+            True,
+        ):
             with patch(
-                "litellm.proxy.proxy_server.premium_user",
-                True,
-            ):
-                with patch(
-                    "litellm.proxy.pass_through_endpoints.pass_through_endpoints.set_env_variables_in_header"
-                ) as mock_set_env:
-                    mock_set_env.return_value = {}
+                "litellm.proxy.pass_through_endpoints.pass_through_endpoints.set_env_variables_in_header"
+            ) as mock_set_env:
+                mock_set_env.return_value = {}
 
-                    # Test endpoint with include_subpath=False (default)
-                    endpoints = [
-                        {
-                            "path": "/test/endpoint",
-                            "target": "http://example.com",
-                            "include_subpath": False,
-                        }
-                    ]
+                # Test endpoint with include_subpath=False (default)
+                endpoints = [
+                    {
+                        "path": "/test/endpoint",
+                        "target": "http://example.com",
+                        "include_subpath": False,
+                    }
+                ]
 
-                    await initialize_pass_through_endpoints(endpoints)
+                await initialize_pass_through_endpoints(endpoints)
 
-                    # Should be called only once for exact path
-                    mock_add_exact_route.assert_called_once()
-                    mock_add_subpath_route.assert_not_called()
+                # Should register only the exact path route
+                mock_add_route.assert_called_once()
 
-                    # Verify exact path route call
-                    exact_call_args = mock_add_exact_route.call_args[1]
-                    assert exact_call_args["path"] == "/test/endpoint"
-                    assert exact_call_args["target"] == "http://example.com"
+                call_args = mock_add_route.call_args[1]
+                assert call_args["path"] == "/test/endpoint"
+                assert call_args["target"] == "http://example.com"
+                assert call_args["include_subpath"] is False
 
 
 def test_set_cost_per_request():
@@ -693,7 +687,7 @@ def test_initialize_pass_through_endpoints_with_cost_per_request():
     mock_app = MagicMock()
 
     # Test exact path route with cost_per_request
-    InitPassThroughEndpointHelpers.add_exact_path_route(
+    InitPassThroughEndpointHelpers.add_route(
         app=mock_app,
         path="/test/path",
         target="http://example.com",
@@ -718,7 +712,7 @@ def test_initialize_pass_through_endpoints_with_cost_per_request():
     mock_app.reset_mock()
 
     # Test subpath route with cost_per_request
-    InitPassThroughEndpointHelpers.add_subpath_route(
+    InitPassThroughEndpointHelpers.add_route(
         app=mock_app,
         path="/test/path",
         target="http://example.com",
@@ -727,11 +721,12 @@ def test_initialize_pass_through_endpoints_with_cost_per_request():
         merge_query_params=False,
         dependencies=[],
         cost_per_request=7.50,
+        include_subpath=True,
     )
 
-    # Verify add_api_route was called for subpath
-    mock_app.add_api_route.assert_called_once()
-    call_args = mock_app.add_api_route.call_args[1]
+    # Verify add_api_route was called for the exact path and the wildcard
+    assert mock_app.add_api_route.call_count == 2
+    call_args = mock_app.add_api_route.call_args_list[1][1]
 
     # Verify the wildcard path and endpoint function
     assert call_args["path"] == "/test/path/{subpath:path}"
@@ -1245,3 +1240,167 @@ async def test_delete_pass_through_endpoint_empty_list():
         # Verify the exception
         assert exc_info.value.status_code == 400
         assert "no pass-through endpoints setup" in str(exc_info.value.detail).lower()
+
+
+@pytest.mark.asyncio
+async def test_pass_through_config_writer_coalesces_burst():
+    """
+    A burst of concurrent mutations should merge into a single
+    update_config_general_settings call containing every mutation.
+    """
+    import asyncio
+
+    from litellm.proxy._types import ConfigFieldInfo, UserAPIKeyAuth
+    from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
+        _PassThroughConfigWriter,
+    )
+
+    writer = _PassThroughConfigWriter()
+    mock_user_api_key_dict = MagicMock(spec=UserAPIKeyAuth)
+
+    with patch(
+        "litellm.proxy.proxy_server.get_config_general_settings",
+        new_callable=AsyncMock,
+    ) as mock_get_config:
+        with patch(
+            "litellm.proxy.proxy_server.update_config_general_settings",
+            new_callable=AsyncMock,
+        ) as mock_update_config:
+            mock_get_config.return_value = ConfigFieldInfo(
+                field_name="pass_through_endpoints", field_value=[]
+            )
+
+            def make_mutator(i):
+                def _append(current):
+                    current = current if current is not None else []
+                    current.append({"id": str(i)})
+                    return current
+
+                return _append
+
+            await asyncio.gather(
+                *[
+                    writer.mutate(
+                        mutator=make_mutator(i),
+                        user_api_key_dict=mock_user_api_key_dict,
+                    )
+                    for i in range(5)
+                ]
+            )
+
+            # one DB write for the whole burst, containing all 5 mutations
+            mock_update_config.assert_called_once()
+            written = mock_update_config.call_args[1]["data"].field_value
+            assert sorted(e["id"] for e in written) == [str(i) for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_pass_through_config_writer_mutator_error_keeps_pending():
+    """
+    A mutator raising mid-burst should propagate to its caller without
+    dropping mutations already applied to the pending value.
+    """
+    import asyncio
+
+    from fastapi import HTTPException
+
+    from litellm.proxy._types import ConfigFieldInfo, UserAPIKeyAuth
+    from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
+        _PassThroughConfigWriter,
+    )
+
+    writer = _PassThroughConfigWriter()
+    mock_user_api_key_dict = MagicMock(spec=UserAPIKeyAuth)
+
+    with patch(
+        "litellm.proxy.proxy_server.get_config_general_settings",
+        new_callable=AsyncMock,
+    ) as mock_get_config:
+        with patch(
+            "litellm.proxy.proxy_server.update_config_general_settings",
+            new_callable=AsyncMock,
+        ) as mock_update_config:
+            mock_get_config.return_value = ConfigFieldInfo(
+                field_name="pass_through_endpoints", field_value=[]
+            )
+
+            def _append(current):
+                current = current if current is not None else []
+                current.append({"id": "kept"})
+                return current
+
+            def _raise(current):
+                raise HTTPException(status_code=404, detail={"error": "not found"})
+
+            first = asyncio.create_task(
+                writer.mutate(mutator=_append, user_api_key_dict=mock_user_api_key_dict)
+            )
+            # let the first mutation apply and schedule the flush
+            await asyncio.sleep(0)
+
+            with pytest.raises(HTTPException):
+                await writer.mutate(
+                    mutator=_raise, user_api_key_dict=mock_user_api_key_dict
+                )
+
+            # the failed mutator must not break the in-flight flush
+            await first
+            mock_update_config.assert_called_once()
+            written = mock_update_config.call_args[1]["data"].field_value
+            assert written == [{"id": "kept"}]
+
+
+@pytest.mark.asyncio
+async def test_pass_through_config_writer_flush_failure_propagates():
+    """
+    A failing DB flush should raise in every caller awaiting that burst.
+    """
+    import asyncio
+
+    from litellm.proxy._types import ConfigFieldInfo, UserAPIKeyAuth
+    from litellm.proxy.pass_through_endpoints.pass_through_endpoints import (
+        _PassThroughConfigWriter,
+    )
+
+    writer = _PassThroughConfigWriter()
+    mock_user_api_key_dict = MagicMock(spec=UserAPIKeyAuth)
+
+    with patch(
+        "litellm.proxy.proxy_server.get_config_general_settings",
+        new_callable=AsyncMock,
+    ) as mock_get_config:
+        with patch(
+            "litellm.proxy.proxy_server.update_config_general_settings",
+            new_callable=AsyncMock,
+        ) as mock_update_config:
+            mock_get_config.return_value = ConfigFieldInfo(
+                field_name="pass_through_endpoints", field_value=[]
+            )
+            mock_update_config.side_effect = Exception("db write failed")
+
+            def _append(current):
+                current = current if current is not None else []
+                current.append({"id": "x"})
+                return current
+
+            results = await asyncio.gather(
+                *[
+                    writer.mutate(
+                        mutator=_append, user_api_key_dict=mock_user_api_key_dict
+                    )
+                    for _ in range(3)
+                ],
+                return_exceptions=True,
+            )
+
+            assert len(results) == 3
+            for result in results:
+                assert isinstance(result, Exception)
+                assert "db write failed" in str(result)
+
+            # a fresh mutation after the failed burst starts a new cycle
+            mock_update_config.side_effect = None
+            await writer.mutate(
+                mutator=_append, user_api_key_dict=mock_user_api_key_dict
+            )
+            assert mock_update_config.call_count == 2